@@ -0,0 +1,27 @@
+"""Convert the historical F1 CSVs in data/ to Parquet.
+
+F1DataLoader reads data/<table>.parquet instead of the CSV whenever the
+Parquet copy is at least as new, and writes one itself after parsing a
+CSV. Running this ahead of time keeps every column and spares the first
+app start the CSV parse.
+
+Usage: python scripts/to_parquet.py
+"""
+import glob
+import os
+
+import pandas as pd
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+
+def convert_all(data_dir: str = DATA_DIR):
+    """Write a zstd-compressed Parquet file next to every CSV in data_dir"""
+    for csv_path in sorted(glob.glob(os.path.join(data_dir, '*.csv'))):
+        parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+        pd.read_csv(csv_path).to_parquet(parquet_path, engine='pyarrow', compression='zstd', index=False)
+        print(f"{os.path.basename(csv_path)} -> {os.path.basename(parquet_path)}")
+
+
+if __name__ == "__main__":
+    convert_all()
@@ -1,23 +1,17 @@
 import streamlit as st
-import sys
-import os
-import time
 from datetime import datetime, timezone
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
+# `streamlit run src/app.py` puts src/ on sys.path, so sibling modules import directly
 from data_loader import F1DataLoader
 from schedule_handler import load_schedule, load_f1_news
-from visualizations import (
-    create_driver_championship_chart,
-    create_constructor_heatmap,
-    create_circuit_winners_chart,
-    create_head_to_head_comparison,
+from html_components import (
     create_stats_cards,
     create_schedule_cards_html,
-    create_news_cards_html
+    create_countdown_html,
+    create_news_cards_html,
 )
+# visualizations (and with it Plotly) is imported only where a chart is built,
+# so the header, calendar and news reach the browser before the chart stack has loaded
 
 # Page configuration
 st.set_page_config(
@@ -28,7 +22,7 @@ st.set_page_config(
 )
 
 # Enhanced Custom CSS with Titillium Web font
-st.markdown("""
+CUSTOM_CSS = """
     <style>
         /* Import Titillium Web font */
         @import url('https://fonts.googleapis.com/css2?family=Titillium+Web:wght@300;400;500;600;700;900&display=swap');
@@ -168,7 +162,47 @@ st.markdown("""
             transform: translateY(-5px);
             box-shadow: 0 8px 25px rgba(225, 6, 0, 0.4);
         }
-        
+
+        /* Top 5 standings cards */
+        .metric-row {
+            display: flex;
+            gap: 1rem;
+        }
+
+        .metric-card {
+            flex: 1;
+            background: linear-gradient(135deg, #15151E 0%, #2a2a3e 100%);
+            padding: 20px;
+            border-radius: 12px;
+            border: 2px solid #E10600;
+            box-shadow: 0 4px 15px rgba(0, 0, 0, 0.3);
+            transition: all 0.3s ease;
+        }
+
+        .metric-card:hover {
+            transform: translateY(-5px);
+            box-shadow: 0 8px 25px rgba(225, 6, 0, 0.4);
+        }
+
+        .metric-card .metric-label {
+            font-size: 1rem;
+            font-weight: 600;
+            color: #FFFFFF;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+        }
+
+        .metric-card .metric-value {
+            font-size: 2.5rem;
+            font-weight: 900;
+            color: #E10600;
+        }
+
+        .metric-card .metric-delta {
+            font-size: 0.9rem;
+            color: #00D084;
+        }
+
         /* Success/Info boxes */
         .stSuccess {
             background-color: rgba(0, 208, 132, 0.1);
@@ -186,6 +220,18 @@ st.markdown("""
             font-weight: 500;
         }
         
+        /* Section spacing inside tabs */
+        .stTabs [data-baseweb="tab-panel"] {
+            padding-top: 1.5rem;
+        }
+        
+        .stTabs .stHorizontalBlock,
+        .stTabs .stPlotlyChart,
+        .stTabs .stIFrame,
+        .stTabs .stHtml {
+            margin-top: 1rem;
+        }
+        
         /* Loading animation */
         .stSpinner > div {
             border-color: #E10600 transparent transparent transparent !important;
@@ -210,7 +256,31 @@ st.markdown("""
             background: #FF6600;
         }
     </style>
-""", unsafe_allow_html=True)
+"""
+
+# Emitted once per full script run; fragment reruns reuse the element already on the page
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+# Legend cards shown under the constructor heatmap: (title, accent color, text)
+HEATMAP_NOTES = [
+    ("HEAT INTENSITY", "#E10600", "Darker red indicates more points scored"),
+    ("TOP TEAMS", "#FF6600", "Shows top 10 constructors by total points"),
+    ("PATTERNS", "#00D0FF", "Identify dominant eras for each team"),
+]
+
+# Built once at import and sent as a single element
+HEATMAP_NOTES_HTML = (
+    '<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;">'
+    + "".join(
+        f'<div style="background: linear-gradient(135deg, #15151E 0%, #2a2a3e 100%); '
+        f'padding: 20px; border-radius: 12px; border-left: 4px solid {color};">'
+        f'<h4 style="color: {color}; margin-top: 0;">{title}</h4>'
+        f'<p style="color: #CCCCCC;">{text}</p>'
+        '</div>'
+        for title, color, text in HEATMAP_NOTES
+    )
+    + '</div>'
+)
 
 @st.cache_resource
 def load_data():
@@ -222,35 +292,324 @@ def load_data():
         st.error("Failed to load data. Please check that CSV files are in the 'data' folder.")
         return None
 
-def show_loading_screen():
-    """Display animated loading screen"""
-    loading_html = """
-    <div style="display: flex; flex-direction: column; align-items: center; justify-content: center; height: 400px;">
-        <div style="font-size: 80px; animation: race 2s infinite;">🏎️</div>
-        <h2 style="color: #E10600; margin-top: 20px; font-family: 'Titillium Web', sans-serif; font-weight: 700; text-transform: uppercase; animation: pulse 1.5s infinite;">Loading 2026 F1 Data</h2>
-        <div style="width: 300px; height: 4px; background: #15151E; border-radius: 2px; margin-top: 20px; overflow: hidden;">
-            <div style="width: 100%; height: 100%; background: linear-gradient(90deg, #E10600, #FF6600); animation: loading 1.5s infinite;"></div>
+@st.cache_data
+def load_available_years(_loader, start_year: int = 2010):
+    """Seasons from start_year onwards, newest first, with caching"""
+    return [year for year in _loader.seasons if year >= start_year]
+
+# Frames derived from the shared loader are cached as resources: every rerun
+# gets the same read-only object back instead of an unpickled copy
+@st.cache_resource
+def load_championship_data(_loader, start_year: int = 2010):
+    """Driver championship progression with caching"""
+    return _loader.get_driver_championship_data(start_year=start_year)
+
+@st.cache_resource
+def load_final_standings(_loader, start_year: int = 2010, top_n: int = 5):
+    """Final top drivers for every season, keyed by year, with caching"""
+    championship_data = load_championship_data(_loader, start_year=start_year)
+    return {
+        year: season.groupby('driver_name', observed=True)['cumulative_points'].max().nlargest(top_n)
+        for year, season in championship_data.groupby('year', sort=False)
+    }
+
+@st.cache_resource
+def load_constructor_data(_loader, start_year: int = 2010):
+    """Constructor championship points with caching"""
+    return _loader.get_constructor_championship_data(start_year=start_year)
+
+@st.cache_resource
+def load_circuit_stats(_loader):
+    """Circuit winner statistics with caching"""
+    return _loader.get_circuit_stats()
+
+@st.cache_resource
+def load_circuits_by_name(_loader):
+    """Circuit winner statistics split per circuit, in name order, with caching"""
+    groups = dict(tuple(load_circuit_stats(_loader).groupby('name', observed=True)))
+    return {name: groups[name] for name in _loader.circuit_names}
+
+@st.cache_resource
+def load_top_drivers(_loader, limit: int = 20):
+    """Top drivers by career points with caching"""
+    return _loader.get_top_drivers_list(limit=limit)
+
+@st.cache_data
+def load_driver_ids(_loader, limit: int = 20):
+    """Map of top driver names to driverId, in career points order, with caching"""
+    top_drivers = load_top_drivers(_loader, limit=limit)
+    return dict(zip(top_drivers['driver_name'], top_drivers['driverId'].astype(int)))
+
+@st.cache_data(max_entries=128)
+def load_head_to_head(_loader, driver1_id: int, driver2_id: int):
+    """Head-to-head comparison with caching (keyed on the ordered driver pair)"""
+    return _loader.get_head_to_head_data(driver1_id, driver2_id)
+
+# Plotly figures are cached on the same small keys as the data they draw,
+# so revisiting a season, circuit or pairing skips the figure rebuild. They
+# are shared resources: st.plotly_chart serialises from fig.to_dict(), a
+# copy, so the cached figure is never modified and needs no per-hit unpickle
+@st.cache_resource(max_entries=32, show_spinner=False)
+def load_championship_chart(_loader, selected_year: int, start_year: int = 2010):
+    """Championship progression figure with caching"""
+    from visualizations import create_driver_championship_chart
+    return create_driver_championship_chart(load_championship_data(_loader, start_year=start_year), selected_year)
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def load_constructor_heatmap(_loader, start_year: int = 2010):
+    """Constructor heatmap figure with caching"""
+    from visualizations import create_constructor_heatmap
+    return create_constructor_heatmap(load_constructor_data(_loader, start_year=start_year))
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def load_circuit_chart(_loader, selected_circuit: str):
+    """Circuit winners figure with caching"""
+    from visualizations import create_circuit_winners_chart
+    return create_circuit_winners_chart(load_circuits_by_name(_loader)[selected_circuit], selected_circuit)
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def load_head_to_head_chart(_loader, driver1_id: int, driver2_id: int):
+    """Head-to-head radar figure with caching"""
+    from visualizations import create_head_to_head_comparison
+    return create_head_to_head_comparison(load_head_to_head(_loader, driver1_id, driver2_id))
+
+@st.cache_data(ttl=60)
+def load_formatted_schedule(_schedule_handler, year: int = 2026):
+    """Upcoming races with caching; short TTL because races drop off as they finish"""
+    return _schedule_handler.get_formatted_schedule()
+
+@st.cache_data(ttl=60)
+def load_schedule_cards_html(_schedule_handler, year: int = 2026):
+    """Rendered race cards with caching, so reruns only rebuild the countdown"""
+    return create_schedule_cards_html(load_formatted_schedule(_schedule_handler, year))
+
+@st.cache_data(ttl=900, max_entries=4)
+def load_news_cards_html(news_data):
+    """Rendered news cards with caching, keyed on the news items themselves"""
+    return create_news_cards_html(news_data)
+
+@st.fragment
+def render_calendar_tab(schedule_handler):
+    """2026 race calendar with countdown to the next Grand Prix"""
+    st.header("2026 FIA Formula 1 World Championship")
+    st.markdown("*Complete race calendar with live countdown to the next Grand Prix*")
+    
+    if schedule_handler and schedule_handler.races:
+        schedule_data = load_formatted_schedule(schedule_handler, schedule_handler.year)
+        
+        if schedule_data:
+            next_race = schedule_handler.get_next_race()
+            
+            # Show upcoming races count
+            st.success(f"🏁 **{len(schedule_data)} upcoming race(s)** in the 2026 season")
+            
+            # The countdown ticks in the browser (its script needs an iframe, st.html drops
+            # scripts), so the server renders it once per rerun and never polls
+            if next_race:
+                countdown = schedule_handler.calculate_countdown(next_race['sessions']['gp'])
+                st.components.v1.html(
+                    create_countdown_html(next_race['name'], next_race['_gp_dt'], countdown), height=120
+                )
+            
+            # Render cards inline in a scrollable container (no iframe)
+            html_output = load_schedule_cards_html(schedule_handler, schedule_handler.year)
+            with st.container(height=800):
+                st.html(html_output)
+        else:
+            st.info("🏆 **2026 F1 Season Complete!** All races have finished.")
+            
+    else:
+        st.warning("⚠️ Unable to load 2026 F1 schedule. You may need to create a schedule file.")
+        st.info("💡 **Tip:** Create a file `data/f1-2026-schedule.json` with the 2026 race calendar data.")
+
+@st.fragment
+def render_news_tab(news_data):
+    """F1 news feed and official sources"""
+    st.header("Latest Formula 1 News")
+    st.markdown("*Stay updated with the latest from the world of F1*")
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.info("📡 **News Integration:** This dashboard can be extended to pull live news from F1 RSS feeds or news APIs")
+    
+    with col2:
+        if st.button("🔄 Refresh News", use_container_width=True):
+            # Only drop the news cache; the historical tables stay warm
+            load_f1_news.clear()
+            st.rerun()
+    
+    # Display news cards
+    news_html = load_news_cards_html(news_data)
+    st.components.v1.html(news_html, height=600, scrolling=True)
+    
+    # Official F1 sources
+    st.markdown("""
+    <div style="background: linear-gradient(135deg, #15151E 0%, #2a2a3e 100%); 
+                padding: 25px; border-radius: 12px; border: 2px solid #E10600;">
+        <h3 style="color: #E10600; margin-top: 0;">🔗 Official F1 Sources</h3>
+        <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin-top: 15px;">
+            <a href="https://www.formula1.com" target="_blank" style="color: #00D0FF; text-decoration: none; font-weight: 600;">
+                🏎️ Formula1.com
+            </a>
+            <a href="https://www.fia.com" target="_blank" style="color: #00D0FF; text-decoration: none; font-weight: 600;">
+                📋 FIA Official
+            </a>
+            <a href="https://www.formula1.com/en/latest.html" target="_blank" style="color: #00D0FF; text-decoration: none; font-weight: 600;">
+                📰 F1 Latest News
+            </a>
+            <a href="https://www.formula1.com/en/results.html" target="_blank" style="color: #00D0FF; text-decoration: none; font-weight: 600;">
+                📊 Race Results
+            </a>
         </div>
     </div>
+    """, unsafe_allow_html=True)
+
+@st.fragment
+def render_championship_tab(loader):
+    """Driver championship progression for the selected season"""
+    st.header("Driver Championship Progression")
+    st.markdown("*Watch how championships unfold race by race*")
     
-    <style>
-        @keyframes race {
-            0%, 100% { transform: translateX(-50px); }
-            50% { transform: translateX(50px); }
-        }
-        
-        @keyframes pulse {
-            0%, 100% { opacity: 1; }
-            50% { opacity: 0.5; }
-        }
-        
-        @keyframes loading {
-            0% { transform: translateX(-100%); }
-            100% { transform: translateX(100%); }
-        }
-    </style>
-    """
-    return loading_html
+    col1, col2 = st.columns([3, 1])
+    
+    with col2:
+        available_years = load_available_years(loader, start_year=2010)
+        
+        selected_year = st.selectbox(
+            "SELECT SEASON",
+            available_years,
+            index=0
+        )
+    
+    with st.spinner('Generating championship visualization...'):
+        fig = load_championship_chart(loader, selected_year, start_year=2010)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    st.subheader(f"Final Top 5 - {selected_year} Season")
+    
+    # Seasons listed in races.csv before their first result have no standings yet
+    final_standings = load_final_standings(loader, start_year=2010).get(selected_year, {})
+    
+    medals = ["🥇", "🥈", "🥉", "4️⃣", "5️⃣"]
+
+    # One markdown block instead of five st.metric widgets
+    cards = "".join(
+        f'<div class="metric-card">'
+        f'<div class="metric-label">{medal} {driver.split()[-1]}</div>'
+        f'<div class="metric-value">{points:.0f}</div>'
+        f'<div class="metric-delta">↑ pts</div>'
+        f'</div>'
+        for medal, (driver, points) in zip(medals, final_standings.items())
+    )
+    st.markdown(f'<div class="metric-row">{cards}</div>', unsafe_allow_html=True)
+
+@st.fragment
+def render_constructors_tab(loader):
+    """Constructor championship heatmap"""
+    st.header("Constructor Championship Heatmap")
+    st.markdown("*Visualize team performance and dominance across seasons*")
+    
+    with st.spinner('Building constructor dominance map...'):
+        fig = load_constructor_heatmap(loader, start_year=2010)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    st.markdown(HEATMAP_NOTES_HTML, unsafe_allow_html=True)
+
+@st.fragment
+def render_circuits_tab(loader):
+    """Most successful drivers at the selected circuit"""
+    st.header("Circuit Performance Analysis")
+    st.markdown("*Discover the masters of each legendary track*")
+    
+    circuits_by_name = load_circuits_by_name(loader)
+    available_circuits = list(circuits_by_name)
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        selected_circuit = st.selectbox(
+            "SELECT CIRCUIT",
+            available_circuits,
+            index=available_circuits.index("Monaco Grand Prix") if "Monaco Grand Prix" in available_circuits else 0
+        )
+    
+    circuit_data = circuits_by_name[selected_circuit]
+    
+    with st.spinner('Analyzing circuit data...'):
+        fig = load_circuit_chart(loader, selected_circuit)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    total_races = circuit_data['wins'].sum()
+    most_successful = circuit_data.iloc[0]
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("TOTAL RACES", total_races)
+    with col2:
+        st.metric("CIRCUIT KING", most_successful['driver_name'])
+    with col3:
+        st.metric("VICTORIES", int(most_successful['wins']))
+
+@st.fragment
+def render_head_to_head_tab(loader):
+    """Head-to-head comparison of two drivers"""
+    st.header("Head-to-Head Driver Comparison")
+    st.markdown("*Compare racing legends and see who dominated the sport*")
+    
+    driver_ids = load_driver_ids(loader, limit=30)
+    driver_names = list(driver_ids)
+    
+    col1, col2, col3 = st.columns([2, 2, 1], vertical_alignment="bottom")
+    
+    with col1:
+        driver1_name = st.selectbox(
+            "DRIVER 1",
+            driver_names,
+            index=0
+        )
+        driver1_id = driver_ids[driver1_name]
+    
+    with col2:
+        driver2_name = st.selectbox(
+            "DRIVER 2",
+            driver_names,
+            index=1 if len(driver_names) > 1 else 0
+        )
+        driver2_id = driver_ids[driver2_name]
+    
+    with col3:
+        compare_button = st.button("COMPARE", type="primary", use_container_width=True)
+    
+    if compare_button:
+        with st.spinner('Analyzing driver statistics...'):
+            comparison = load_head_to_head(loader, driver1_id, driver2_id)
+            
+            st.markdown(create_stats_cards(comparison), unsafe_allow_html=True)
+            
+            fig = load_head_to_head_chart(loader, driver1_id, driver2_id)
+            st.plotly_chart(fig, use_container_width=True)
+            
+            st.markdown("---")
+            
+            if comparison['driver1_total_points'] > comparison['driver2_total_points']:
+                winner = comparison['driver1']
+                margin = comparison['driver1_total_points'] - comparison['driver2_total_points']
+                color = "#00D0FF"
+            else:
+                winner = comparison['driver2']
+                margin = comparison['driver2_total_points'] - comparison['driver1_total_points']
+                color = "#FF6600"
+            
+            st.markdown(f"""
+                <div style="text-align: center; padding: 30px; background: linear-gradient(135deg, #15151E 0%, #2a2a3e 100%); 
+                            border-radius: 15px; border: 3px solid {color}; box-shadow: 0 0 30px rgba(225, 6, 0, 0.3);">
+                    <h2 style="color: {color}; margin: 0; font-size: 2.5rem; text-transform: uppercase; font-weight: 900;">{winner}</h2>
+                    <p style="color: #FFFFFF; font-size: 1.5rem; margin-top: 10px; font-weight: 500;">
+                        LEADS BY <span style="color: {color}; font-weight: 900;">{margin:.0f}</span> CAREER POINTS
+                    </p>
+                </div>
+            """, unsafe_allow_html=True)
 
 def main():
     # Animated Header
@@ -265,22 +624,16 @@ def main():
     
     st.markdown("---")
     
-    # Show loading screen while data loads
-    loading_placeholder = st.empty()
-    loading_placeholder.markdown(show_loading_screen(), unsafe_allow_html=True)
-    
-    # Load historical data
-    loader = load_data()
-    
-    # Load schedule data for 2026
-    schedule_handler = load_schedule(2026)
-    
-    # Load F1 news
-    news_data = load_f1_news()
-    
-    # Clear loading screen
-    time.sleep(0.5)
-    loading_placeholder.empty()
+    # Spinner clears as soon as loading finishes
+    with st.spinner('Loading 2026 F1 data...'):
+        # Load historical data
+        loader = load_data()
+        
+        # Load schedule data for 2026
+        schedule_handler = load_schedule(2026)
+        
+        # Load F1 news
+        news_data = load_f1_news()
     
     if loader is None:
         st.stop()
@@ -297,272 +650,29 @@ def main():
     
     # TAB 1: 2026 Race Schedule
     with tab1:
-        st.markdown("<br>", unsafe_allow_html=True)
-        st.header("2026 FIA Formula 1 World Championship")
-        st.markdown("*Complete race calendar with live countdown to the next Grand Prix*")
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        if schedule_handler and schedule_handler.races:
-            schedule_data = schedule_handler.get_formatted_schedule()
-            
-            if schedule_data:
-                next_race = schedule_handler.get_next_race()
-                
-                countdown = None
-                if next_race:
-                    countdown = schedule_handler.calculate_countdown(next_race['sessions']['gp'])
-                
-                # Show upcoming races count
-                st.success(f"🏁 **{len(schedule_data)} upcoming race(s)** in the 2026 season")
-                
-                # Render cards
-                html_output = create_schedule_cards_html(schedule_data, countdown)
-                st.components.v1.html(html_output, height=800, scrolling=True)
-            else:
-                st.info("🏆 **2026 F1 Season Complete!** All races have finished.")
-                
-        else:
-            st.warning("⚠️ Unable to load 2026 F1 schedule. You may need to create a schedule file.")
-            st.info("💡 **Tip:** Create a file `data/f1-2026-schedule.json` with the 2026 race calendar data.")
-            
+        render_calendar_tab(schedule_handler)
+    
     # TAB 2: F1 News Feed
     with tab2:
-        st.markdown("<br>", unsafe_allow_html=True)
-        st.header("Latest Formula 1 News")
-        st.markdown("*Stay updated with the latest from the world of F1*")
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            st.info("📡 **News Integration:** This dashboard can be extended to pull live news from F1 RSS feeds or news APIs")
-        
-        with col2:
-            if st.button("🔄 Refresh News", use_container_width=True):
-                st.cache_data.clear()
-                st.rerun()
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        # Display news cards
-        news_html = create_news_cards_html(news_data)
-        st.components.v1.html(news_html, height=600, scrolling=True)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        # Official F1 sources
-        st.markdown("""
-        <div style="background: linear-gradient(135deg, #15151E 0%, #2a2a3e 100%); 
-                    padding: 25px; border-radius: 12px; border: 2px solid #E10600;">
-            <h3 style="color: #E10600; margin-top: 0;">🔗 Official F1 Sources</h3>
-            <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin-top: 15px;">
-                <a href="https://www.formula1.com" target="_blank" style="color: #00D0FF; text-decoration: none; font-weight: 600;">
-                    🏎️ Formula1.com
-                </a>
-                <a href="https://www.fia.com" target="_blank" style="color: #00D0FF; text-decoration: none; font-weight: 600;">
-                    📋 FIA Official
-                </a>
-                <a href="https://www.formula1.com/en/latest.html" target="_blank" style="color: #00D0FF; text-decoration: none; font-weight: 600;">
-                    📰 F1 Latest News
-                </a>
-                <a href="https://www.formula1.com/en/results.html" target="_blank" style="color: #00D0FF; text-decoration: none; font-weight: 600;">
-                    📊 Race Results
-                </a>
-            </div>
-        </div>
-        """, unsafe_allow_html=True)
+        render_news_tab(news_data)
     
     # TAB 3: Championship Evolution
     with tab3:
-        st.markdown("<br>", unsafe_allow_html=True)
-        st.header("Driver Championship Progression")
-        st.markdown("*Watch how championships unfold race by race*")
-        
-        col1, col2 = st.columns([3, 1])
-        
-        with col2:
-            available_years = sorted(loader.races['year'].unique(), reverse=True)
-            available_years = [y for y in available_years if y >= 2010]
-            
-            st.markdown("<br>", unsafe_allow_html=True)
-            selected_year = st.selectbox(
-                "SELECT SEASON",
-                available_years,
-                index=0
-            )
-        
-        championship_data = loader.get_driver_championship_data(start_year=2010)
-        
-        with st.spinner('Generating championship visualization...'):
-            fig = create_driver_championship_chart(championship_data, selected_year)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        st.subheader(f"Final Top 5 - {selected_year} Season")
-        
-        year_final = championship_data[championship_data['year'] == selected_year]
-        final_standings = year_final.groupby('driver_name')['cumulative_points'].max().sort_values(ascending=False).head(5)
-        
-        cols = st.columns(5)
-        medals = ["🥇", "🥈", "🥉", "4️⃣", "5️⃣"]
-        
-        for idx, (col, (driver, points)) in enumerate(zip(cols, final_standings.items())):
-            with col:
-                st.metric(
-                    label=f"{medals[idx]} {driver.split()[-1]}",
-                    value=f"{points:.0f}",
-                    delta="pts"
-                )
+        render_championship_tab(loader)
     
     # TAB 4: Constructor Dominance
     with tab4:
-        st.markdown("<br>", unsafe_allow_html=True)
-        st.header("Constructor Championship Heatmap")
-        st.markdown("*Visualize team performance and dominance across seasons*")
-        
-        constructor_data = loader.get_constructor_championship_data(start_year=2010)
-        
-        with st.spinner('Building constructor dominance map...'):
-            fig = create_constructor_heatmap(constructor_data)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #15151E 0%, #2a2a3e 100%); 
-                        padding: 20px; border-radius: 12px; border-left: 4px solid #E10600;">
-                <h4 style="color: #E10600; margin-top: 0;">HEAT INTENSITY</h4>
-                <p style="color: #CCCCCC;">Darker red indicates more points scored</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #15151E 0%, #2a2a3e 100%); 
-                        padding: 20px; border-radius: 12px; border-left: 4px solid #FF6600;">
-                <h4 style="color: #FF6600; margin-top: 0;">TOP TEAMS</h4>
-                <p style="color: #CCCCCC;">Shows top 10 constructors by total points</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown("""
-            <div style="background: linear-gradient(135deg, #15151E 0%, #2a2a3e 100%); 
-                        padding: 20px; border-radius: 12px; border-left: 4px solid #00D0FF;">
-                <h4 style="color: #00D0FF; margin-top: 0;">PATTERNS</h4>
-                <p style="color: #CCCCCC;">Identify dominant eras for each team</p>
-            </div>
-            """, unsafe_allow_html=True)
+        render_constructors_tab(loader)
     
     # TAB 5: Circuit Analysis
     with tab5:
-        st.markdown("<br>", unsafe_allow_html=True)
-        st.header("Circuit Performance Analysis")
-        st.markdown("*Discover the masters of each legendary track*")
-        
-        circuit_stats = loader.get_circuit_stats()
-        available_circuits = sorted(circuit_stats['name'].unique())
-        
-        col1, col2 = st.columns([2, 1])
-        
-        with col1:
-            selected_circuit = st.selectbox(
-                "SELECT CIRCUIT",
-                available_circuits,
-                index=available_circuits.index("Monaco Grand Prix") if "Monaco Grand Prix" in available_circuits else 0
-            )
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        
-        with st.spinner('Analyzing circuit data...'):
-            fig = create_circuit_winners_chart(circuit_stats, selected_circuit)
-            st.plotly_chart(fig, use_container_width=True)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        circuit_data = circuit_stats[circuit_stats['name'] == selected_circuit]
-        total_races = circuit_data['wins'].sum()
-        most_successful = circuit_data.iloc[0]
-        
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("TOTAL RACES", total_races)
-        with col2:
-            st.metric("CIRCUIT KING", most_successful['driver_name'])
-        with col3:
-            st.metric("VICTORIES", int(most_successful['wins']))
+        render_circuits_tab(loader)
     
     # TAB 6: Driver Comparisons
     with tab6:
-        st.markdown("<br>", unsafe_allow_html=True)
-        st.header("Head-to-Head Driver Comparison")
-        st.markdown("*Compare racing legends and see who dominated the sport*")
-        
-        top_drivers = loader.get_top_drivers_list(limit=30)
-        
-        st.markdown("<br>", unsafe_allow_html=True)
-        col1, col2, col3 = st.columns([2, 2, 1])
-        
-        with col1:
-            driver1_name = st.selectbox(
-                "DRIVER 1",
-                top_drivers['driver_name'].tolist(),
-                index=0
-            )
-            driver1_id = top_drivers[top_drivers['driver_name'] == driver1_name]['driverId'].values[0]
-        
-        with col2:
-            driver2_name = st.selectbox(
-                "DRIVER 2",
-                top_drivers['driver_name'].tolist(),
-                index=1 if len(top_drivers) > 1 else 0
-            )
-            driver2_id = top_drivers[top_drivers['driver_name'] == driver2_name]['driverId'].values[0]
-        
-        with col3:
-            st.markdown("<br><br>", unsafe_allow_html=True)
-            compare_button = st.button("COMPARE", type="primary", use_container_width=True)
-        
-        if compare_button:
-            with st.spinner('Analyzing driver statistics...'):
-                time.sleep(0.5)
-                
-                comparison = loader.get_head_to_head_data(driver1_id, driver2_id)
-                
-                st.markdown("<br>", unsafe_allow_html=True)
-                st.markdown(create_stats_cards(comparison), unsafe_allow_html=True)
-                
-                st.markdown("<br>", unsafe_allow_html=True)
-                
-                fig = create_head_to_head_comparison(comparison)
-                st.plotly_chart(fig, use_container_width=True)
-                
-                st.markdown("<br>", unsafe_allow_html=True)
-                st.markdown("---")
-                
-                if comparison['driver1_total_points'] > comparison['driver2_total_points']:
-                    winner = comparison['driver1']
-                    margin = comparison['driver1_total_points'] - comparison['driver2_total_points']
-                    color = "#00D0FF"
-                else:
-                    winner = comparison['driver2']
-                    margin = comparison['driver2_total_points'] - comparison['driver1_total_points']
-                    color = "#FF6600"
-                
-                st.markdown(f"""
-                    <div style="text-align: center; padding: 30px; background: linear-gradient(135deg, #15151E 0%, #2a2a3e 100%); 
-                                border-radius: 15px; border: 3px solid {color}; box-shadow: 0 0 30px rgba(225, 6, 0, 0.3);">
-                        <h2 style="color: {color}; margin: 0; font-size: 2.5rem; text-transform: uppercase; font-weight: 900;">{winner}</h2>
-                        <p style="color: #FFFFFF; font-size: 1.5rem; margin-top: 10px; font-weight: 500;">
-                            LEADS BY <span style="color: {color}; font-weight: 900;">{margin:.0f}</span> CAREER POINTS
-                        </p>
-                    </div>
-                """, unsafe_allow_html=True)
+        render_head_to_head_tab(loader)
     
     # Footer
-    st.markdown("<br><br>", unsafe_allow_html=True)
     st.markdown("---")
     st.markdown(f"""
         <div style='text-align: center; padding: 20px;'>
@@ -1,32 +1,119 @@
 import pandas as pd
+import numpy as np
 import os
+import sys
+import glob
+import hashlib
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Tuple
 
+# Columns read from each source table, with the compact dtype they are kept in
+TABLE_SCHEMAS = {
+    "races.csv": {'raceId': 'int16', 'year': 'int16', 'round': 'int8', 'circuitId': 'int16', 'name': 'category'},
+    "results.csv": {'raceId': 'int16', 'driverId': 'int16', 'constructorId': 'int16',
+                    'positionOrder': 'int8', 'points': 'float32'},
+    "drivers.csv": {'driverId': 'int16', 'forename': 'object', 'surname': 'object'},
+    "constructors.csv": {'constructorId': 'int16', 'name': 'category'},
+}
+
 class F1DataLoader:
     """Load and process F1 historical data from CSV files"""
     
     def __init__(self, data_dir: str = "../data"):
 
         self.data_dir = data_dir
+        self.cache_dir = os.path.join(data_dir, ".cache")
         self.races = None
         self.results = None
         self.drivers = None
         self.constructors = None
-        self.qualifying = None
+        self.results_enriched = None
+        self.results_by_driver = None
+        self.driver_names = None
+        self.driver_total_points = None
+        self.circuit_stats = None
+        self.seasons = None
+        self.circuit_names = None
+        
+    def _cache_path(self) -> str:
+        """Pickle path keyed on the mtimes of the CSVs and of this module"""
+        sources = [os.path.join(self.data_dir, name) for name in TABLE_SCHEMAS] + [__file__]
+        # Pickles aren't guaranteed to load across Python/pandas/numpy upgrades
+        versions = [sys.version, pd.__version__, np.__version__]
+        stamp = "|".join([str(os.path.getmtime(path)) for path in sources] + versions)
+        key = hashlib.md5(stamp.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"loader-{key}.pkl")
+    
+    def _load_from_cache(self, cache_path: str) -> bool:
+        """Restore processed frames from a previous run, if available"""
+        if not os.path.exists(cache_path):
+            return False
+        try:
+            with open(cache_path, 'rb') as f:
+                self.__dict__.update(pickle.load(f))
+            return True
+        except Exception as e:
+            print(f"Ignoring unreadable data cache: {e}")
+            return False
+    
+    def _save_to_cache(self, cache_path: str):
+        """Pickle processed frames and drop caches for older CSV versions"""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for stale in glob.glob(os.path.join(self.cache_dir, "loader-*.pkl")):
+                os.remove(stale)
+            state = {k: v for k, v in self.__dict__.items() if k not in ('data_dir', 'cache_dir')}
+            with open(cache_path, 'wb') as f:
+                pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"Could not write data cache: {e}")
+        
+    def _read_table(self, csv_name: str) -> pd.DataFrame:
+        """Read the used columns of a source table, preferring an up-to-date Parquet copy"""
+        schema = TABLE_SCHEMAS[csv_name]
+        csv_path = os.path.join(self.data_dir, csv_name)
+        parquet_path = os.path.splitext(csv_path)[0] + ".parquet"
+        if os.path.exists(parquet_path) and os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path):
+            try:
+                return pd.read_parquet(parquet_path, engine='pyarrow', columns=list(schema)).astype(schema)
+            except Exception as e:
+                print(f"Re-reading {csv_name}, Parquet copy is unusable: {e}")
+        df = pd.read_csv(csv_path, usecols=list(schema), dtype=schema, engine='pyarrow')
+        self._write_parquet(df, parquet_path)
+        return df
+    
+    @staticmethod
+    def _write_parquet(df: pd.DataFrame, parquet_path: str):
+        """Save a Parquet copy of a freshly parsed CSV so later cold starts skip the parse"""
+        try:
+            df.to_parquet(parquet_path, engine='pyarrow', compression='zstd', index=False)
+        except Exception as e:
+            print(f"Could not write {os.path.basename(parquet_path)}: {e}")
         
-    def load_all_data(self) -> bool:
+    def load_all_data(self, use_cache: bool = True) -> bool:
         """Load all CSV files and return success status"""
         try:
-            # Load CSV files
-            self.races = pd.read_csv(os.path.join(self.data_dir, "races.csv"))
-            self.results = pd.read_csv(os.path.join(self.data_dir, "results.csv"))
-            self.drivers = pd.read_csv(os.path.join(self.data_dir, "drivers.csv"))
-            self.constructors = pd.read_csv(os.path.join(self.data_dir, "constructors.csv"))
-            self.qualifying = pd.read_csv(os.path.join(self.data_dir, "qualifying.csv"))
+            # Reuse the processed frames from a previous run if the CSVs are unchanged
+            cache_path = self._cache_path() if use_cache else None
+            if cache_path and self._load_from_cache(cache_path):
+                return True
+            
+            # Load source tables (Parquet when converted, CSV otherwise); the
+            # parsers release the GIL, so the reads overlap in threads
+            with ThreadPoolExecutor(max_workers=len(TABLE_SCHEMAS)) as executor:
+                tables = dict(zip(TABLE_SCHEMAS, executor.map(self._read_table, TABLE_SCHEMAS)))
+            self.races = tables["races.csv"]
+            self.results = tables["results.csv"]
+            self.drivers = tables["drivers.csv"]
+            self.constructors = tables["constructors.csv"]
             
             # Basic data cleaning
             self._clean_data()
             
+            if cache_path:
+                self._save_to_cache(cache_path)
+            
             return True
         except Exception as e:
             print(f"Error loading data: {e}")
@@ -34,117 +121,128 @@ class F1DataLoader:
     
     def _clean_data(self):
         """Clean and prepare data for analysis"""
-        # Convert position to numeric, handling 'R' (retired) and 'W' (withdrawn)
-        self.results['positionOrder'] = pd.to_numeric(self.results['positionOrder'], errors='coerce')
-        
-        # Ensure year is integer
-        self.races['year'] = self.races['year'].astype(int)
-        
         # Handle missing values in points
         self.results['points'] = self.results['points'].fillna(0)
         
-    def get_driver_championship_data(self, start_year: int = 2010) -> pd.DataFrame:
-        """Get driver championship points progression by year"""
-        # Merge results with races to get year information
-        merged = self.results.merge(self.races[['raceId', 'year', 'round']], on='raceId')
+        # Build full names once on the small drivers table; as categories they
+        # stay compact when joined onto every result row
+        self.drivers['driver_name'] = pd.Categorical(self.drivers['forename'] + ' ' + self.drivers['surname'])
+        
+        # Join results with race, driver and constructor details once, in
+        # chronological order, so the getters below only filter and group
+        races = self.races.set_index('raceId')[['year', 'round', 'name', 'circuitId']]
+        constructors = self.constructors.set_index('constructorId')[['name']].rename(columns={'name': 'constructor_name'})
+        driver_names = self.drivers.set_index('driverId')['driver_name']
+        self.results_enriched = (
+            self.results
+            .join(races, on='raceId', how='inner')
+            .join(driver_names, on='driverId', how='inner')
+            .join(constructors, on='constructorId', how='inner')
+            .sort_values(['year', 'round'], kind='mergesort')
+            .reset_index(drop=True)
+        )
+        
+        # Wins per circuit per driver, circuits alphabetical and most wins first
+        winners = self.results_enriched[self.results_enriched['positionOrder'] == 1]
+        circuit_stats = winners.groupby(['name', 'driver_name'], observed=True).size().reset_index(name='wins')
+        self.circuit_stats = circuit_stats.sort_values(
+            ['name', 'wins', 'driver_name'], ascending=[True, False, True]
+        ).reset_index(drop=True)
+        
+        # Selector options for the dashboard, newest season first and circuits alphabetical
+        self.seasons = sorted(self.races['year'].unique().tolist(), reverse=True)
+        self.circuit_names = self.circuit_stats['name'].unique().tolist()
         
-        # Filter by year
-        merged = merged[merged['year'] >= start_year]
+        # Career points per driver, best first, for the top drivers list
+        self.driver_total_points = self.results_enriched.groupby('driverId')['points'].sum().sort_values(ascending=False)
         
-        # Merge with drivers to get driver names
-        merged = merged.merge(
-            self.drivers[['driverId', 'forename', 'surname']], 
-            on='driverId'
+        # Plain driverId -> name lookup for the interactive paths
+        self.driver_names = driver_names.astype(str).to_dict()
+        
+        # Per-driver slices for head-to-head lookups, sorted so .loc can binary search
+        self.results_by_driver = (
+            self.results_enriched[['driverId', 'positionOrder', 'points']]
+            .set_index('driverId')
+            .sort_index()
         )
-        merged['driver_name'] = merged['forename'] + ' ' + merged['surname']
+    
+    @staticmethod
+    def _grouped_cumsum(keys: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """Running total of values within each key, in the original row order"""
+        if len(keys) == 0:
+            return values.copy()
+        order = np.argsort(keys, kind='stable')
+        sorted_keys, sorted_values = keys[order], values[order]
+        totals = np.cumsum(sorted_values)
+        
+        # Subtract the running total reached before each group starts
+        starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        offsets = np.repeat(totals[starts] - sorted_values[starts], np.diff(np.r_[starts, len(keys)]))
+        
+        result = np.empty_like(totals)
+        result[order] = totals - offsets
+        return result
+    
+    def get_driver_championship_data(self, start_year: int = 2010) -> pd.DataFrame:
+        """Get driver championship points progression by year"""
+        merged = self.results_enriched[self.results_enriched['year'] >= start_year]
         
-        # Calculate cumulative points per driver per year
-        merged = merged.sort_values(['year', 'driverId', 'round'])
-        merged['cumulative_points'] = merged.groupby(['year', 'driverId'])['points'].cumsum()
+        # Rows are already in (year, round) order, so a segmented cumsum per season and driver suffices;
+        # assign builds a new frame rather than writing into the slice
+        merged = merged.assign(cumulative_points=self._grouped_cumsum(
+            merged['year'].to_numpy(np.int64) * 100000 + merged['driverId'].to_numpy(np.int64),
+            merged['points'].to_numpy(np.float64),
+        ))
         
         return merged[['year', 'round', 'driver_name', 'driverId', 'cumulative_points', 'points']]
     
     def get_constructor_championship_data(self, start_year: int = 2010) -> pd.DataFrame:
         """Get constructor championship data by year"""
-        # Merge results with races and constructors
-        merged = self.results.merge(self.races[['raceId', 'year']], on='raceId')
-        merged = merged.merge(
-            self.constructors[['constructorId', 'name']], 
-            on='constructorId'
-        )
-        
-        # Filter by year
-        merged = merged[merged['year'] >= start_year]
+        merged = self.results_enriched[self.results_enriched['year'] >= start_year]
         
         # Group by year and constructor
-        constructor_points = merged.groupby(['year', 'name'])['points'].sum().reset_index()
+        constructor_points = merged.groupby(['year', 'constructor_name'], observed=True)['points'].sum().reset_index()
         
-        return constructor_points
+        return constructor_points.rename(columns={'constructor_name': 'name'})
     
     def get_circuit_stats(self) -> pd.DataFrame:
         """Get statistics for each circuit"""
-        # Merge results with races to get circuit info
-        merged = self.results.merge(
-            self.races[['raceId', 'year', 'name', 'circuitId']], 
-            on='raceId'
-        )
-        
-        # Get winners (position 1)
-        winners = merged[merged['positionOrder'] == 1].copy()
-        
-        # Merge with drivers
-        winners = winners.merge(
-            self.drivers[['driverId', 'forename', 'surname']], 
-            on='driverId'
-        )
-        winners['driver_name'] = winners['forename'] + ' ' + winners['surname']
-        
-        # Count wins per circuit per driver
-        circuit_stats = winners.groupby(['name', 'driver_name']).size().reset_index(name='wins')
-        circuit_stats = circuit_stats.sort_values(['name', 'wins'], ascending=[True, False])
-        
-        return circuit_stats
+        return self.circuit_stats
     
     def get_head_to_head_data(self, driver1_id: int, driver2_id: int) -> Dict:
         """Compare two drivers head-to-head across their careers"""
-        # Get all results for both drivers
-        driver1_results = self.results[self.results['driverId'] == driver1_id].copy()
-        driver2_results = self.results[self.results['driverId'] == driver2_id].copy()
-        
-        # Merge with races to get year
-        driver1_results = driver1_results.merge(self.races[['raceId', 'year']], on='raceId')
-        driver2_results = driver2_results.merge(self.races[['raceId', 'year']], on='raceId')
-        
-        # Get driver names
-        driver1_name = self.drivers[self.drivers['driverId'] == driver1_id].iloc[0]
-        driver2_name = self.drivers[self.drivers['driverId'] == driver2_id].iloc[0]
+        # Aggregate both drivers' results in one pass over their index slices
+        rows = self.results_by_driver.loc[self.results_by_driver.index.intersection([driver1_id, driver2_id])]
+        stats = rows.assign(
+            win=rows['positionOrder'] == 1,
+            podium=rows['positionOrder'] <= 3,
+        ).groupby(level='driverId').agg(
+            wins=('win', 'sum'),
+            podiums=('podium', 'sum'),
+            total_points=('points', 'sum'),
+            avg_position=('positionOrder', 'mean'),
+        ).reindex([driver1_id, driver2_id])
+        stats[['wins', 'podiums', 'total_points']] = stats[['wins', 'podiums', 'total_points']].fillna(0)
+        driver1_stats, driver2_stats = stats.iloc[0], stats.iloc[1]
         
         comparison = {
-            'driver1': f"{driver1_name['forename']} {driver1_name['surname']}",
-            'driver2': f"{driver2_name['forename']} {driver2_name['surname']}",
-            'driver1_wins': len(driver1_results[driver1_results['positionOrder'] == 1]),
-            'driver2_wins': len(driver2_results[driver2_results['positionOrder'] == 1]),
-            'driver1_podiums': len(driver1_results[driver1_results['positionOrder'] <= 3]),
-            'driver2_podiums': len(driver2_results[driver2_results['positionOrder'] <= 3]),
-            'driver1_total_points': driver1_results['points'].sum(),
-            'driver2_total_points': driver2_results['points'].sum(),
-            'driver1_avg_position': driver1_results['positionOrder'].mean(),
-            'driver2_avg_position': driver2_results['positionOrder'].mean(),
+            'driver1': self.driver_names[driver1_id],
+            'driver2': self.driver_names[driver2_id],
+            'driver1_wins': int(driver1_stats['wins']),
+            'driver2_wins': int(driver2_stats['wins']),
+            'driver1_podiums': int(driver1_stats['podiums']),
+            'driver2_podiums': int(driver2_stats['podiums']),
+            'driver1_total_points': driver1_stats['total_points'],
+            'driver2_total_points': driver2_stats['total_points'],
+            'driver1_avg_position': driver1_stats['avg_position'],
+            'driver2_avg_position': driver2_stats['avg_position'],
         }
         
         return comparison
     
     def get_top_drivers_list(self, limit: int = 20) -> pd.DataFrame:
         """Get list of top drivers by total career points"""
-        # Calculate total points per driver
-        driver_points = self.results.groupby('driverId')['points'].sum().reset_index()
-        driver_points = driver_points.sort_values('points', ascending=False).head(limit)
-        
-        # Merge with driver names
-        driver_points = driver_points.merge(
-            self.drivers[['driverId', 'forename', 'surname']], 
-            on='driverId'
-        )
-        driver_points['driver_name'] = driver_points['forename'] + ' ' + driver_points['surname']
+        driver_points = self.driver_total_points.head(limit).reset_index()
+        driver_points['driver_name'] = driver_points['driverId'].map(self.driver_names)
         
-        return driver_points[['driverId', 'driver_name', 'points']].reset_index(drop=True)
\ No newline at end of file
+        return driver_points[['driverId', 'driver_name', 'points']]
\ No newline at end of file
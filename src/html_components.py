@@ -0,0 +1,608 @@
+from typing import TYPE_CHECKING, Dict, List
+from datetime import datetime
+from functools import lru_cache
+
+if TYPE_CHECKING:
+    from schedule_handler import RaceView
+
+# Flag emoji by country code, for the race cards
+FLAG_EMOJIS = {
+    'BHR': '🇧🇭', 'SAU': '🇸🇦', 'AUS': '🇦🇺', 'JPN': '🇯🇵', 'CHN': '🇨🇳',
+    'USA': '🇺🇸', 'ITA': '🇮🇹', 'MCO': '🇲🇨', 'ESP': '🇪🇸', 'CAN': '🇨🇦',
+    'AUT': '🇦🇹', 'GBR': '🇬🇧', 'HUN': '🇭🇺', 'BEL': '🇧🇪', 'NLD': '🇳🇱',
+    'AZE': '🇦🇿', 'SGP': '🇸🇬', 'MEX': '🇲🇽', 'BRA': '🇧🇷', 'UAE': '🇦🇪',
+    'QAT': '🇶🇦', 'LVA': '🇱🇻', 'PRT': '🇵🇹', 'F1': '🏁',
+    'FRA': '🇫🇷', 'DEU': '🇩🇪', 'TUR': '🇹🇷', 'RUS': '🇷🇺'
+}
+
+
+# Display name and accent color for each session key in the schedule JSON
+SESSION_NAMES = {
+    'fp1': 'Practice 1',
+    'fp2': 'Practice 2',
+    'fp3': 'Practice 3',
+    'qualifying': 'Qualifying',
+    'sprint': 'Sprint Race',
+    'sprintQualifying': 'Sprint Qualifying',
+    'gp': 'Race'
+}
+SESSION_COLORS = {
+    'fp1': '#666666',
+    'fp2': '#666666',
+    'fp3': '#666666',
+    'qualifying': '#FF6600',
+    'sprint': '#00D084',
+    'sprintQualifying': '#00D084',
+    'gp': '#E10600'
+}
+
+
+def create_stats_cards(comparison: Dict) -> str:
+    """Create HTML for statistics cards"""
+    html = f"""
+    <style>
+        .stats-container {{
+            display: flex;
+            justify-content: space-around;
+            margin: 20px 0;
+        }}
+        .stat-card {{
+            background: #15151E;
+            border: 2px solid #E10600;
+            border-radius: 10px;
+            padding: 20px;
+            text-align: center;
+            min-width: 150px;
+        }}
+        .stat-value {{
+            font-size: 32px;
+            font-weight: bold;
+            color: #E10600;
+        }}
+        .stat-label {{
+            font-size: 14px;
+            color: #FFFFFF;
+            margin-top: 5px;
+        }}
+        .driver-name {{
+            font-size: 18px;
+            font-weight: bold;
+            color: #FFFFFF;
+            margin-bottom: 10px;
+        }}
+    </style>
+    
+    <div class="stats-container">
+        <div class="stat-card">
+            <div class="driver-name">{comparison['driver1']}</div>
+            <div class="stat-value">{comparison['driver1_wins']}</div>
+            <div class="stat-label">Wins</div>
+        </div>
+        <div class="stat-card">
+            <div class="driver-name">{comparison['driver2']}</div>
+            <div class="stat-value">{comparison['driver2_wins']}</div>
+            <div class="stat-label">Wins</div>
+        </div>
+    </div>
+    
+    <div class="stats-container">
+        <div class="stat-card">
+            <div class="stat-value">{comparison['driver1_podiums']}</div>
+            <div class="stat-label">Podiums</div>
+        </div>
+        <div class="stat-card">
+            <div class="stat-value">{comparison['driver2_podiums']}</div>
+            <div class="stat-label">Podiums</div>
+        </div>
+    </div>
+    
+    <div class="stats-container">
+        <div class="stat-card">
+            <div class="stat-value">{comparison['driver1_total_points']:.0f}</div>
+            <div class="stat-label">Career Points</div>
+        </div>
+        <div class="stat-card">
+            <div class="stat-value">{comparison['driver2_total_points']:.0f}</div>
+            <div class="stat-label">Career Points</div>
+        </div>
+    </div>
+    """
+    
+    return html
+
+
+def get_flag_emoji(country_code: str) -> str:
+    """Return country flag emoji"""
+    return FLAG_EMOJIS.get(country_code, '🏁')
+
+
+def get_status_icon_svg(is_past: bool, is_next: bool) -> str:
+    """Return status icon SVG"""
+    if is_next:
+        return '''
+            <svg width="24" height="24" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
+                <circle cx="12" cy="12" r="10" stroke="#00D084" stroke-width="2" fill="none"/>
+                <circle cx="12" cy="12" r="6" fill="#00D084">
+                    <animate attributeName="r" values="6;8;6" dur="1.5s" repeatCount="indefinite"/>
+                </circle>
+            </svg>
+        '''
+    elif is_past:
+        return '''
+            <svg width="24" height="24" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
+                <path d="M20 6L9 17l-5-5" stroke="#666666" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/>
+            </svg>
+        '''
+    else:
+        return '''
+            <svg width="24" height="24" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
+                <circle cx="12" cy="12" r="10" stroke="#E10600" stroke-width="2" fill="none"/>
+            </svg>
+        '''
+
+
+# Memoised: every schedule render formats the same handful of session times
+@lru_cache(maxsize=1024)
+def format_session_time(iso_datetime: str) -> tuple:
+    """Format session time to readable format"""
+    try:
+        dt = datetime.fromisoformat(iso_datetime.replace('Z', '+00:00'))
+        date_str = dt.strftime('%a, %b %d')
+        time_str = dt.strftime('%H:%M UTC')
+        return date_str, time_str
+    except (AttributeError, ValueError):
+        return "TBA", "TBA"
+
+
+# Styles for the race schedule cards; constant, so it is built once at import
+SCHEDULE_CARDS_CSS = '''
+    <style>
+        .schedule-container {
+            display: grid;
+            grid-template-columns: repeat(auto-fill, minmax(400px, 1fr));
+            gap: 24px;
+            padding: 20px 0;
+        }
+        
+        .race-card {
+            background: linear-gradient(135deg, #15151E 0%, #1a1a2e 100%);
+            border-radius: 16px;
+            overflow: hidden;
+            border: 2px solid #2a2a3e;
+            transition: all 0.3s ease;
+            position: relative;
+        }
+        
+        .race-card:hover {
+            transform: translateY(-8px);
+            box-shadow: 0 12px 40px rgba(0, 0, 0, 0.4);
+            border-color: #E10600;
+        }
+        
+        .race-card.next-race {
+            border: 3px solid #00D084;
+            box-shadow: 0 0 30px rgba(0, 208, 132, 0.3);
+        }
+        
+        .race-card.next-race:hover {
+            box-shadow: 0 12px 40px rgba(0, 208, 132, 0.4);
+        }
+        
+        .race-card-header {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            padding: 16px 20px;
+            background: rgba(0, 0, 0, 0.3);
+            border-bottom: 1px solid #2a2a3e;
+        }
+        
+        .round-badge {
+            font-family: 'Titillium Web', sans-serif;
+            font-weight: 700;
+            font-size: 0.75rem;
+            letter-spacing: 1px;
+            color: #E10600;
+            background: rgba(225, 6, 0, 0.1);
+            padding: 6px 12px;
+            border-radius: 6px;
+            border: 1px solid #E10600;
+        }
+        
+        .status-icon {
+            display: flex;
+            align-items: center;
+        }
+        
+        .race-card-body {
+            padding: 24px 20px;
+        }
+        
+        .race-details {
+            display: flex;
+            flex-direction: column;
+            gap: 12px;
+        }
+        
+        .race-flag {
+            font-size: 3rem;
+            line-height: 1;
+            margin-bottom: 8px;
+        }
+        
+        .race-name {
+            font-family: 'Titillium Web', sans-serif;
+            font-weight: 700;
+            font-size: 1.4rem;
+            color: #FFFFFF;
+            margin: 0;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+            line-height: 1.3;
+        }
+        
+        .race-location {
+            display: flex;
+            align-items: center;
+            gap: 6px;
+            font-size: 0.95rem;
+            color: #AAAAAA;
+            font-weight: 500;
+            margin-bottom: 8px;
+        }
+        
+        .sessions-schedule {
+            display: flex;
+            flex-direction: column;
+            gap: 10px;
+            margin-top: 12px;
+        }
+        
+        .session-item {
+            display: flex;
+            align-items: center;
+            gap: 12px;
+            padding: 12px 16px;
+            background: rgba(225, 6, 0, 0.05);
+            border-radius: 8px;
+            border-left: 4px solid #E10600;
+            transition: all 0.2s ease;
+        }
+        
+        .session-item:hover {
+            background: rgba(225, 6, 0, 0.1);
+            transform: translateX(5px);
+        }
+        
+        .session-info {
+            flex: 1;
+        }
+        
+        .session-name {
+            font-family: 'Titillium Web', sans-serif;
+            font-weight: 600;
+            font-size: 0.9rem;
+            color: #FFFFFF;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+        }
+        
+        .session-time {
+            font-size: 0.85rem;
+            color: #AAAAAA;
+            margin-top: 2px;
+        }
+        
+        @media (max-width: 768px) {
+            .schedule-container {
+                grid-template-columns: 1fr;
+            }
+        }
+    </style>
+    '''
+
+
+# Markup for one session row and one race card, filled in with str.format
+SESSION_ITEM_TEMPLATE = '''
+                <div class="session-item" style="border-left-color: {color};">
+                    <div class="session-info">
+                        <div class="session-name">{display_name}</div>
+                        <div class="session-time">{date_str} • {time_str}</div>
+                    </div>
+                </div>
+                '''
+
+RACE_CARD_TEMPLATE = '''
+    <div class="race-card {status_class}">
+        <div class="race-card-header">
+            <div class="round-badge">ROUND {round_no}</div>
+            <div class="status-icon">{status_icon}</div>
+        </div>
+        
+        <div class="race-card-body">
+            <div class="race-details">
+                <div class="race-flag">{flag}</div>
+                <h3 class="race-name">{race_name}</h3>
+                <div class="race-location">
+                    <svg width="16" height="16" viewBox="0 0 24 24" fill="none" xmlns="http://www.w3.org/2000/svg">
+                        <path d="M21 10c0 7-9 13-9 13s-9-6-9-13a9 9 0 0 1 18 0z" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round"/>
+                        <circle cx="12" cy="10" r="3" stroke="currentColor" stroke-width="2"/>
+                    </svg>
+                    {circuit}, {location}
+                </div>
+                
+                {sessions_html}
+            </div>
+        </div>
+    </div>
+    '''
+
+
+# Memoised: a card only changes when its race or its past/next status does,
+# so reruns after the next race moves on rebuild just the affected cards
+@lru_cache(maxsize=64)
+def _render_race_card(round_no: int, race_name: str, country_code: str, circuit: str, location: str,
+                      sessions: tuple, is_past: bool, is_next: bool) -> str:
+    """Create HTML for one race card; sessions is a tuple of (key, ISO time) pairs"""
+    status_class = 'next-race' if is_next else ('past-race' if is_past else 'upcoming-race')
+    status_icon = get_status_icon_svg(is_past, is_next)
+    flag = get_flag_emoji(country_code)
+    
+    # Get all sessions from the raw race data
+    sessions_html = ''
+    if sessions:
+        session_parts = ['<div class="sessions-schedule">']
+        for key, value in sessions:
+            if value:
+                date_str, time_str = format_session_time(value)
+                display_name = SESSION_NAMES.get(key, key)
+                color = SESSION_COLORS.get(key, '#666666')
+                
+                session_parts.append(SESSION_ITEM_TEMPLATE.format(
+                    color=color, display_name=display_name, date_str=date_str, time_str=time_str
+                ))
+        session_parts.append('</div>')
+        sessions_html = ''.join(session_parts)
+    
+    return RACE_CARD_TEMPLATE.format(
+        status_class=status_class, round_no=round_no, status_icon=status_icon, flag=flag,
+        race_name=race_name, circuit=circuit, location=location, sessions_html=sessions_html
+    )
+
+
+def create_schedule_cards_html(schedule_data: List['RaceView']) -> str:
+    """Create HTML for race schedule cards with F1 styling and ALL session data"""
+    
+    parts = ['<div class="schedule-container">']
+    
+    for race in schedule_data:
+        parts.append(_render_race_card(
+            race.round, race.race_name, race.country_code, race.circuit, race.location,
+            tuple(race.sessions.items()) if race.sessions else (), race.is_past, race.is_next
+        ))
+    
+    parts.append('</div>')
+    
+    # Enhanced CSS for race cards
+    parts.append(SCHEDULE_CARDS_CSS)
+    
+    return ''.join(parts)
+
+
+def create_countdown_html(race_name: str, race_start: datetime, countdown: Dict[str, int]) -> str:
+    """Create HTML for the next race countdown banner, ticking every second in the browser"""
+    race_timestamp = int(race_start.timestamp() * 1000)
+    
+    html = f'''
+    <div class="countdown-banner" data-race-time="{race_timestamp}">
+        <div class="countdown-title">Next: {race_name}</div>
+        <div class="countdown-section">
+            <div class="countdown-number" id="countdown-days">{countdown['days']}</div>
+            <div class="countdown-label">DAYS</div>
+        </div>
+        <div class="countdown-section">
+            <div class="countdown-number" id="countdown-hours">{countdown['hours']:02d}</div>
+            <div class="countdown-label">HRS</div>
+        </div>
+        <div class="countdown-section">
+            <div class="countdown-number" id="countdown-minutes">{countdown['minutes']:02d}</div>
+            <div class="countdown-label">MIN</div>
+        </div>
+        <div class="countdown-section">
+            <div class="countdown-number" id="countdown-seconds">{countdown['seconds']:02d}</div>
+            <div class="countdown-label">SEC</div>
+        </div>
+    </div>
+    '''
+    
+    html += '''
+    <style>
+        .countdown-banner {
+            display: flex;
+            justify-content: space-around;
+            padding: 20px;
+            background: linear-gradient(135deg, #00D084 0%, #00a066 100%);
+            border-radius: 16px;
+            box-shadow: 0 0 30px rgba(0, 208, 132, 0.3);
+        }
+        
+        .countdown-title {
+            font-family: 'Titillium Web', sans-serif;
+            font-weight: 700;
+            font-size: 1.1rem;
+            color: #FFFFFF;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+            align-self: center;
+        }
+        
+        .countdown-section {
+            text-align: center;
+        }
+        
+        .countdown-number {
+            font-family: 'Titillium Web', sans-serif;
+            font-weight: 700;
+            font-size: 2rem;
+            color: #FFFFFF;
+            line-height: 1;
+        }
+        
+        .countdown-label {
+            font-family: 'Titillium Web', sans-serif;
+            font-weight: 600;
+            font-size: 0.7rem;
+            color: rgba(255, 255, 255, 0.9);
+            margin-top: 4px;
+            letter-spacing: 1px;
+        }
+        
+        body {
+            margin: 0;
+        }
+    </style>
+    
+    <script>
+        function updateCountdowns() {
+            const element = document.querySelector('.countdown-banner');
+            const raceTime = parseInt(element.getAttribute('data-race-time'));
+            const diff = Math.max(raceTime - Date.now(), 0);
+            
+            const days = Math.floor(diff / (1000 * 60 * 60 * 24));
+            const hours = Math.floor((diff % (1000 * 60 * 60 * 24)) / (1000 * 60 * 60));
+            const minutes = Math.floor((diff % (1000 * 60 * 60)) / (1000 * 60));
+            const seconds = Math.floor((diff % (1000 * 60)) / 1000);
+            
+            document.getElementById('countdown-days').textContent = days;
+            document.getElementById('countdown-hours').textContent = String(hours).padStart(2, '0');
+            document.getElementById('countdown-minutes').textContent = String(minutes).padStart(2, '0');
+            document.getElementById('countdown-seconds').textContent = String(seconds).padStart(2, '0');
+        }
+        
+        updateCountdowns();
+        setInterval(updateCountdowns, 1000);
+    </script>
+    '''
+    
+    return html
+
+
+def create_news_cards_html(news_data: List[Dict]) -> str:
+    """Create HTML for F1 news cards"""
+    
+    html = '<div class="news-container">'
+    
+    for news in news_data:
+        html += f'''
+        <div class="news-card">
+            <div class="news-header">
+                <span class="news-date">📅 {news.get('date', 'Recent')}</span>
+            </div>
+            <div class="news-body">
+                <h3 class="news-title">{news.get('title', 'F1 News')}</h3>
+                <p class="news-summary">{news.get('summary', 'Click to read more...')}</p>
+            </div>
+            <div class="news-footer">
+                <a href="{news.get('url', '#')}" target="_blank" class="news-link">
+                    Read Full Article →
+                </a>
+            </div>
+        </div>
+        '''
+    
+    html += '</div>'
+    
+    # Enhanced CSS for news cards
+    html += '''
+    <style>
+        .news-container {
+            display: grid;
+            grid-template-columns: repeat(auto-fill, minmax(350px, 1fr));
+            gap: 24px;
+            padding: 20px 0;
+        }
+        
+        .news-card {
+            background: linear-gradient(135deg, #15151E 0%, #1a1a2e 100%);
+            border-radius: 16px;
+            overflow: hidden;
+            border: 2px solid #2a2a3e;
+            transition: all 0.3s ease;
+            display: flex;
+            flex-direction: column;
+        }
+        
+        .news-card:hover {
+            transform: translateY(-8px);
+            box-shadow: 0 12px 40px rgba(225, 6, 0, 0.3);
+            border-color: #E10600;
+        }
+        
+        .news-header {
+            padding: 16px 20px;
+            background: rgba(0, 0, 0, 0.3);
+            border-bottom: 1px solid #2a2a3e;
+        }
+        
+        .news-date {
+            font-size: 0.85rem;
+            color: #AAAAAA;
+            font-weight: 500;
+        }
+        
+        .news-body {
+            padding: 24px 20px;
+            flex: 1;
+        }
+        
+        .news-title {
+            font-family: 'Titillium Web', sans-serif;
+            font-weight: 700;
+            font-size: 1.3rem;
+            color: #FFFFFF;
+            margin: 0 0 12px 0;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+            line-height: 1.3;
+        }
+        
+        .news-summary {
+            font-size: 0.95rem;
+            color: #CCCCCC;
+            line-height: 1.6;
+            margin: 0;
+        }
+        
+        .news-footer {
+            padding: 16px 20px;
+            background: rgba(0, 0, 0, 0.2);
+            border-top: 1px solid #2a2a3e;
+        }
+        
+        .news-link {
+            color: #E10600;
+            text-decoration: none;
+            font-weight: 700;
+            font-size: 0.9rem;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+            transition: all 0.2s ease;
+            display: inline-flex;
+            align-items: center;
+            gap: 8px;
+        }
+        
+        .news-link:hover {
+            color: #FF6600;
+            transform: translateX(5px);
+        }
+        
+        @media (max-width: 768px) {
+            .news-container {
+                grid-template-columns: 1fr;
+            }
+        }
+    </style>
+    '''
+    
+    return html
\ No newline at end of file
@@ -1,10 +1,76 @@
 import json
+import logging
 import os
+import sys
+from bisect import bisect_left, bisect_right
+from functools import cached_property, lru_cache
 from datetime import datetime, timezone
-from typing import List, Dict, Optional
+from typing import List, Dict, NamedTuple, Optional
 import streamlit as st
-import requests
-from bs4 import BeautifulSoup
+
+# orjson parses bytes directly and faster; the stdlib parser also accepts bytes
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# Python 3.11+ parses a trailing 'Z' natively; older versions need an explicit offset
+_FROMISO_ACCEPTS_Z = sys.version_info >= (3, 11)
+
+# Country codes by race name, for the flags on the race cards
+COUNTRY_CODES = {
+    'Australian': 'AUS', 'Chinese': 'CHN', 'Japanese': 'JPN',
+    'Bahrain': 'BHR', 'Saudi Arabian': 'SAU', 'Miami': 'USA',
+    'Emilia Romagna': 'ITA', 'Monaco': 'MCO',
+    'Spanish': 'ESP', 'Canadian': 'CAN', 'Austrian': 'AUT',
+    'British': 'GBR', 'Belgian': 'BEL', 'Hungarian': 'HUN',
+    'Dutch': 'NLD', 'Italian': 'ITA', 'Azerbaijan': 'AZE',
+    'Singapore': 'SGP', 'United States': 'USA', 'Mexican': 'MEX',
+    'Brazilian': 'BRA', 'Las Vegas': 'USA', 'Qatar': 'QAT',
+    'Abu Dhabi': 'UAE', 'Portuguese': 'PRT', 'Turkish': 'TUR',
+    'Russian': 'RUS', 'French': 'FRA', 'German': 'DEU'
+}
+
+# Keys every race entry in the schedule JSON must have
+RACE_FIELDS = ('round', 'name', 'location', 'sessions')
+
+# English month names, so date strings don't depend on the process locale
+_MONTHS = ('', 'January', 'February', 'March', 'April', 'May', 'June',
+           'July', 'August', 'September', 'October', 'November', 'December')
+
+# Schedule file found for each year, and the races parsed from each file
+# along with the (mtime, size) they were read at
+_RESOLVED_PATHS: Dict[int, str] = {}
+_PARSED_SCHEDULES: Dict[str, tuple] = {}
+
+
+# Memoised: the countdown re-parses the same target on every rerun
+@lru_cache(maxsize=64)
+def parse_utc(iso_string: str) -> datetime:
+    """Parse an ISO 8601 timestamp such as '2026-03-08T04:00:00Z'"""
+    if not _FROMISO_ACCEPTS_Z and iso_string.endswith('Z'):
+        iso_string = iso_string[:-1] + '+00:00'
+    return datetime.fromisoformat(iso_string)
+
+
+class RaceView(NamedTuple):
+    """Display fields for one race on the calendar"""
+    meeting_key: int
+    round: int
+    race_name: str
+    country: str
+    country_code: str
+    circuit: str
+    location: str
+    date: datetime
+    date_str: str
+    time_str: str
+    is_past: bool
+    is_next: bool
+    sessions: Dict[str, str]
+
 
 class F1ScheduleHandler:
     """Handles F1 race schedule from local JSON file"""
@@ -12,71 +78,101 @@ class F1ScheduleHandler:
     def __init__(self, year: int = 2026):
         self.year = year
         self.races = []
+        self._gp_dates = []
+        
+    def _find_schedule_file(self) -> Optional[str]:
+        """Locate the schedule JSON, reusing the path found by an earlier load"""
+        json_path = _RESOLVED_PATHS.get(self.year)
+        if json_path and os.path.exists(json_path):
+            return json_path
+        
+        # Try multiple path strategies
+        possible_paths = [
+            os.path.join('data', f'f1-{self.year}-schedule.json'),
+            os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', f'f1-{self.year}-schedule.json'),
+            f'data/f1-{self.year}-schedule.json',
+            f'./data/f1-{self.year}-schedule.json'
+        ]
+        
+        for path in possible_paths:
+            if os.path.exists(path):
+                _RESOLVED_PATHS[self.year] = path
+                return path
         
+        logger.warning("Could not find schedule file for %s", self.year)
+        if logger.isEnabledFor(logging.DEBUG):
+            # None of these exist, so list them without stat-ing again
+            logger.debug("Tried paths %s from %s", possible_paths, os.getcwd())
+        return None
+    
     def load_schedule(self) -> bool:
         """Load schedule from local JSON file"""
         try:
-            # Try multiple path strategies
-            possible_paths = [
-                os.path.join('data', f'f1-{self.year}-schedule.json'),
-                os.path.join(os.path.dirname(os.path.dirname(__file__)), 'data', f'f1-{self.year}-schedule.json'),
-                f'data/f1-{self.year}-schedule.json',
-                f'./data/f1-{self.year}-schedule.json'
-            ]
-            
-            json_path = None
-            for path in possible_paths:
-                if os.path.exists(path):
-                    json_path = path
-                    break
-            
+            json_path = self._find_schedule_file()
             if not json_path:
-                print(f"Could not find schedule file. Tried paths:")
-                for path in possible_paths:
-                    print(f"  - {path} (exists: {os.path.exists(path)})")
-                print(f"Current working directory: {os.getcwd()}")
                 return False
             
-            print(f"Loading schedule from: {json_path}")
+            # Skip the parse when the file is unchanged since it was last read
+            stat = os.stat(json_path)
+            signature = (stat.st_mtime_ns, stat.st_size)
+            cached = _PARSED_SCHEDULES.get(json_path)
+            if cached and cached[0] == signature:
+                races = cached[1]
+            else:
+                logger.info("Loading schedule from: %s", json_path)
+                with open(json_path, 'rb') as f:
+                    races = json_loads(f.read()).get('races', [])
+                _PARSED_SCHEDULES[json_path] = (signature, races)
             
-            with open(json_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.races = data.get('races', [])
+            # Shallow copies, since indexing adds fields to each race
+            self.races = [dict(race) for race in races]
+            self._index_race_dates()
             
-            print(f"Loaded {len(self.races)} races")
+            logger.info("Loaded %d races", len(self.races))
             return len(self.races) > 0
             
         except Exception as e:
-            print(f"Error loading schedule: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error loading schedule: %s", e)
             return False
     
-    def get_next_race(self) -> Optional[Dict]:
-        """Get the next upcoming race"""
-        now = datetime.now(timezone.utc)
-        
+    def _index_race_dates(self):
+        """Drop malformed races, parse each race start once and order the calendar by it"""
+        valid = []
         for race in self.races:
+            missing = [field for field in RACE_FIELDS if field not in race]
+            if missing:
+                logger.warning("Skipping race %s, missing %s", race.get('name'), ', '.join(missing))
+                continue
             try:
-                race_date = datetime.fromisoformat(race['sessions']['gp'].replace('Z', '+00:00'))
-                if race_date > now:
-                    return race
-            except:
+                race['_gp_dt'] = parse_utc(race['sessions']['gp'])
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                logger.warning("Skipping race %s, unreadable start: %s", race['name'], e)
                 continue
+            # Naive times can't be ordered against the UTC ones (or against now)
+            if race['_gp_dt'].tzinfo is None:
+                logger.warning("Skipping race %s, start has no UTC offset", race['name'])
+                continue
+            valid.append(race)
         
-        return None
+        self.races = sorted(valid, key=lambda race: race['_gp_dt'])
+        self._gp_dates = [race['_gp_dt'] for race in self.races]
+        # Formatted records are rebuilt from the new calendar on next access
+        self.__dict__.pop('formatted_schedule', None)
+    
+    def get_next_race(self) -> Optional[Dict]:
+        """Get the next upcoming race"""
+        idx = bisect_right(self._gp_dates, datetime.now(timezone.utc))
+        return self.races[idx] if idx < len(self.races) else None
     
     def calculate_countdown(self, target_date_str: str) -> Dict[str, int]:
         """Calculate time until target date"""
-        now = datetime.now(timezone.utc)
-        target = datetime.fromisoformat(target_date_str.replace('Z', '+00:00'))
-        delta = target - now
+        remaining = (parse_utc(target_date_str) - datetime.now(timezone.utc)).total_seconds()
         
-        if delta.total_seconds() < 0:
+        if remaining < 0:
             return {'days': 0, 'hours': 0, 'minutes': 0, 'seconds': 0, 'expired': True}
         
-        days = delta.days
-        hours, remainder = divmod(delta.seconds, 3600)
+        days, remainder = divmod(int(remaining), 86400)
+        hours, remainder = divmod(remainder, 3600)
         minutes, seconds = divmod(remainder, 60)
         
         return {
@@ -87,58 +183,43 @@ class F1ScheduleHandler:
             'expired': False
         }
     
-    def get_formatted_schedule(self) -> List[Dict]:
-        """Get formatted schedule data for display - UPCOMING RACES ONLY"""
+    def _format_races(self) -> List[RaceView]:
+        """Build the display fields for every race, in start order"""
         formatted = []
-        now = datetime.now(timezone.utc)
-        
         for race in self.races:
-            try:
-                race_date = datetime.fromisoformat(race['sessions']['gp'].replace('Z', '+00:00'))
-                
-                # ONLY include future races
-                if race_date < now:
-                    continue
-                
-                # Map country codes
-                country_codes = {
-                    'Australian': 'AUS', 'Chinese': 'CHN', 'Japanese': 'JPN',
-                    'Bahrain': 'BHR', 'Saudi Arabian': 'SAU', 'Miami': 'USA',
-                    'Emilia Romagna': 'ITA', 'Monaco': 'MCO',
-                    'Spanish': 'ESP', 'Canadian': 'CAN', 'Austrian': 'AUT',
-                    'British': 'GBR', 'Belgian': 'BEL', 'Hungarian': 'HUN',
-                    'Dutch': 'NLD', 'Italian': 'ITA', 'Azerbaijan': 'AZE',
-                    'Singapore': 'SGP', 'United States': 'USA', 'Mexican': 'MEX',
-                    'Brazilian': 'BRA', 'Las Vegas': 'USA', 'Qatar': 'QAT',
-                    'Abu Dhabi': 'UAE', 'Portuguese': 'PRT', 'Turkish': 'TUR',
-                    'Russian': 'RUS', 'French': 'FRA', 'German': 'DEU'
-                }
-                
-                formatted.append({
-                    'meeting_key': race['round'],
-                    'round': race['round'],
-                    'race_name': f"{race['name']} Grand Prix",
-                    'country': race['name'],
-                    'country_code': country_codes.get(race['name'], 'F1'),
-                    'circuit': race['location'],
-                    'location': race['location'],
-                    'date': race_date,
-                    'date_str': race_date.strftime('%B %d, %Y'),
-                    'time_str': race_date.strftime('%H:%M'),
-                    'is_past': False,
-                    'is_next': False,
-                    'sessions': race['sessions']
-                })
-            except Exception as e:
-                print(f"Error processing race: {e}")
-                continue
+            race_date = race['_gp_dt']
+            formatted.append(RaceView(
+                meeting_key=race['round'],
+                round=race['round'],
+                race_name=f"{race['name']} Grand Prix",
+                country=race['name'],
+                country_code=COUNTRY_CODES.get(race['name'], 'F1'),
+                circuit=race['location'],
+                location=race['location'],
+                date=race_date,
+                date_str=f"{_MONTHS[race_date.month]} {race_date.day:02d}, {race_date.year}",
+                time_str=f"{race_date.hour:02d}:{race_date.minute:02d}",
+                is_past=False,
+                is_next=False,
+                sessions=race['sessions']
+            ))
         
-        # Sort by date
-        formatted.sort(key=lambda x: x['date'])
+        return formatted
+    
+    @cached_property
+    def formatted_schedule(self) -> List[RaceView]:
+        """Every race formatted for display, in start order"""
+        return self._format_races()
+    
+    def get_formatted_schedule(self, now: Optional[datetime] = None) -> List[RaceView]:
+        """Get formatted schedule data for display - UPCOMING RACES ONLY"""
+        # ONLY include future races
+        idx = bisect_left(self._gp_dates, now or datetime.now(timezone.utc))
+        formatted = self.formatted_schedule[idx:]
         
         # Mark the first race as "next"
         if formatted:
-            formatted[0]['is_next'] = True
+            formatted[0] = formatted[0]._replace(is_next=True)
         
         return formatted
 
@@ -154,7 +235,9 @@ class F1NewsHandler:
         try:
             # Using a news API or RSS feed would be ideal
             # For now, we'll return placeholder structure
-            # In production, you'd integrate with F1's RSS feed or a news API
+            # In production, you'd integrate with F1's RSS feed or a news API;
+            # import requests / bs4 here rather than at module level so their
+            # import cost is only paid when news is actually fetched
             
             # Example structure of what would be returned:
             news_items = [
@@ -167,21 +250,21 @@ class F1NewsHandler:
             ]
             
         except Exception as e:
-            print(f"Error fetching news: {e}")
+            logger.error("Error fetching news: %s", e)
         
         return news_items
 
 
-@st.cache_data(ttl=3600)
+@st.cache_resource(ttl=3600, max_entries=4, show_spinner=False)
 def load_schedule(year: int = 2026):
-    """Load schedule with caching"""
+    """Load schedule with caching (the handler is shared, read-only after load)"""
     handler = F1ScheduleHandler(year=year)
     if handler.load_schedule():
         return handler
     return None
 
 
-@st.cache_data(ttl=1800)
+@st.cache_data(ttl=900, max_entries=4, show_spinner=False)
 def load_f1_news():
-    """Load F1 news with caching (30 min TTL)"""
+    """Load F1 news with caching (15 min TTL)"""
     return F1NewsHandler.fetch_f1_news()
\ No newline at end of file